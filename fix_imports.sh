@@ -1,10 +1,13 @@
 #!/bin/bash
 
+TAB=$'\t'
+
 # Fix imports in drive package files
 for f in internal/cli/drive/*.go; do
-    # Add cli import after the package declaration and import opening
-    sed -i '' '/^import (/a\
-\tcli "github.com/dl-alexandre/gdrv/internal/cli"' "$f"
+    # Add cli import after the package declaration and import opening.
+    # BSD sed turns "\t" into a plain "t", so escape a literal tab instead.
+    sed -i '' "/^import (/a\\
+\\${TAB}cli \"github.com/dl-alexandre/gdrv/internal/cli\"" "$f"
 done
 
 # Fix references in drive package - replace Globals with cli.Globals, etc.
@@ -0,0 +1,447 @@
+import hashlib
+import json
+import mmap
+import os
+import queue
+import re
+import shutil
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import ahocorasick
+except ImportError:  # optional; fall back to the alternation regex
+    ahocorasick = None
+
+MODULE = 'github.com/dl-alexandre/gdrv'
+
+cli_dir = 'internal/cli'
+
+# Upper bound on files read but not yet written back
+MAX_IN_FLIGHT = 64
+
+# Records (mtime_ns, size) of files known to be fully migrated, so reruns
+# can skip them without reading
+CACHE_PATH = '.migrate_cache.json'
+
+# Mapping of files to their destination packages
+file_mapping = {
+    # Drive operations
+    'files.go': 'drive',
+    'folders.go': 'drive',
+    'drives.go': 'drive',
+    'permissions.go': 'drive',
+    'changes.go': 'drive',
+    'labels.go': 'drive',
+
+    # Workspace
+    'sheets.go': 'workspace',
+    'docs.go': 'workspace',
+    'slides.go': 'workspace',
+    'forms.go': 'workspace',
+    'appscript.go': 'workspace',
+
+    # Admin
+    'admin.go': 'admin',
+    'iamadmin.go': 'admin',
+    'groups.go': 'admin',
+
+    # Other services
+    'chat.go': 'chat',
+    'gmail.go': 'gmail',
+    'people.go': 'people',
+    'calendar.go': 'calendar',
+    'tasks.go': 'calendar',
+    'meet.go': 'calendar',
+    'activity.go': 'activity',
+    'sync.go': 'sync',
+
+    # System
+    'auth.go': 'system',
+    'config.go': 'system',
+    'about.go': 'system',
+    'completion.go': 'system',
+    'ai.go': 'system',
+    'cloudlogging.go': 'system',
+    'monitoring.go': 'system',
+
+    # Test files
+    'sheets_test.go': 'workspace',
+    'docs_test.go': 'workspace',
+    'slides_test.go': 'workspace',
+    'admin_test.go': 'admin',
+    'auth_error_test.go': 'system',
+    'parse_test.go': 'system',
+    'config_parse_bool_test.go': 'system',
+}
+
+packages = sorted(set(file_mapping.values()))
+
+# Unqualified identifiers and where they live after the split: output
+# helpers go to the base package, everything else is exported from root cli
+REPLACEMENTS = {
+    b'NewOutputWriter(': b'base.NewOutputWriter(',
+    b'handleCLIError(': b'base.HandleCLIError(',
+    b'convertDriveFile(': b'base.ConvertDriveFile(',
+    b'truncate(': b'base.Truncate(',
+    b'formatSize(': b'base.FormatSize(',
+    b'ResolveFileID(': b'cli.ResolveFileID(',
+    b'GetGlobalFlags()': b'cli.GetGlobalFlags()',
+    b'GetLogger()': b'cli.GetLogger()',
+    b'GetPathResolver(': b'cli.GetPathResolver(',
+    b'GetResolveOptions(': b'cli.GetResolveOptions(',
+    b'isPath(': b'cli.IsPath(',
+    b'getConfigDir()': b'cli.GetConfigDir()',
+    b'resolveTimeRange(': b'cli.ResolveTimeRange(',
+    b'splitCSV(': b'cli.SplitCSV(',
+    b'scopesForPreset(': b'cli.ScopesForPreset(',
+    b'resolveAuthScopes(': b'cli.ResolveAuthScopes(',
+    b'validateAdminScopesRequireImpersonation(': b'cli.ValidateAdminScopesRequireImpersonation(',
+    b'buildOAuthClientError(': b'cli.BuildOAuthClientError(',
+    b'oauthClientSource': b'cli.OAuthClientSource',
+    b'oauthClientSourceFlags': b'cli.OAuthClientSourceFlags',
+    b'oauthClientSourceEnv': b'cli.OAuthClientSourceEnv',
+    b'oauthClientSourceConfig': b'cli.OAuthClientSourceConfig',
+    b'oauthClientSourceBundled': b'cli.OAuthClientSourceBundled',
+    b'isTruthyEnv(': b'cli.IsTruthyEnv(',
+    b'buildAuthFlowError(': b'cli.BuildAuthFlowError(',
+    b'oauthClientSecretHint(': b'cli.OAuthClientSecretHint(',
+    b'openBrowser(': b'cli.OpenBrowser(',
+}
+
+# Only bare references are rewritten: a key preceded by an identifier
+# character or a '.' is part of another name or already qualified, so
+# rerunning the migration is a no-op. Longest keys first so
+# oauthClientSourceFlags wins over oauthClientSource.
+_REPLACEMENT_RE = re.compile(rb'(?<![\w.])(?:%s)' % b'|'.join(
+    re.escape(k) + (rb'\b' if k[-1:].isalnum() else b'')
+    for k in sorted(REPLACEMENTS, key=len, reverse=True)
+))
+
+_PACKAGE_RE = re.compile(rb'^package (\w+)', re.MULTILINE)
+_IMPORT_BLOCK_RE = re.compile(rb'^import \(\n', re.MULTILINE)
+_SINGLE_IMPORT_RE = re.compile(rb'^import ("[^"]+")$', re.MULTILINE)
+_RUN_SIG_RE = re.compile(rb'func \(cmd \*(\w+)\) Run\(globals \*Globals\)')
+
+# Anything an in-place file could still need besides its package line
+_SENTINEL_RE = re.compile(_REPLACEMENT_RE.pattern + b'|' + _RUN_SIG_RE.pattern)
+
+# (usage, import path, import spec) for packages the rewrite may introduce
+_IMPORTS = (
+    (re.compile(rb'(?<![\w.])cli\.'), b'"%s/internal/cli"' % MODULE.encode(),
+     b'cli "%s/internal/cli"' % MODULE.encode()),
+    (re.compile(rb'(?<![\w.])base\.'), b'"%s/internal/cli/base"' % MODULE.encode(),
+     b'"%s/internal/cli/base"' % MODULE.encode()),
+)
+
+def _is_word(char):
+    return char.isalnum() or char == b'_'
+
+def _build_automaton(table):
+    automaton = ahocorasick.Automaton()
+    for old, new in table.items():
+        # The default wheel is built for str keys; latin-1 maps bytes 1:1 so
+        # match offsets are still byte offsets
+        key = old.decode('latin-1') if ahocorasick.unicode else old
+        automaton.add_word(key, (len(old), new))
+    automaton.make_automaton()
+    return automaton
+
+_AUTOMATON = _build_automaton(REPLACEMENTS) if ahocorasick else None
+
+def replace_all(content):
+    if _AUTOMATON is None:
+        return _REPLACEMENT_RE.sub(lambda m: REPLACEMENTS[m.group(0)], content)
+
+    haystack = content.decode('latin-1') if ahocorasick.unicode else content
+    # Build the output in one growing buffer rather than a copy per match
+    out = bytearray()
+    pos = 0
+    # iter_long yields leftmost-longest, non-overlapping matches in order;
+    # the boundary checks mirror _REPLACEMENT_RE
+    for end, (length, new) in _AUTOMATON.iter_long(haystack):
+        start = end - length + 1
+        before = content[start - 1:start]
+        if before and (_is_word(before) or before == b'.'):
+            continue
+        if _is_word(content[end:end + 1]) and _is_word(content[end + 1:end + 2]):
+            continue
+        out += memoryview(content)[pos:start]
+        out += new
+        pos = end + 1
+    if not pos:
+        return content
+    out += memoryview(content)[pos:]
+    return bytes(out)
+
+def add_import(content, spec):
+    # Splice into the first import block; nothing past it needs scanning
+    match = _IMPORT_BLOCK_RE.search(content)
+    if match:
+        return content[:match.end()] + b'\t' + spec + b'\n' + content[match.end():]
+    # Turn a single-line import into a block
+    return _SINGLE_IMPORT_RE.sub(
+        lambda m: b'import (\n\t' + spec + b'\n\t' + m.group(1) + b'\n)',
+        content,
+        count=1
+    )
+
+def _needs_fix(buf, pkg):
+    match = _PACKAGE_RE.search(buf)
+    if match and match.group(1) != pkg.encode():
+        return True
+    if _SENTINEL_RE.search(buf):
+        return True
+    # A package that is used but not imported still needs its import
+    return any(
+        usage_re.search(buf) and path not in buf
+        for usage_re, path, _ in _IMPORTS
+    )
+
+def read_source(src, dst, pkg):
+    """Return the bytes of src, or None if it is already migrated."""
+    with open(src, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return b''
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Files already in place are only copied out when there's work
+            if src == dst and not _needs_fix(mm, pkg):
+                return None
+            return mm[:]
+
+def _copy_tail(src_file, dst_file, offset):
+    try:
+        while sent := os.sendfile(dst_file.fileno(), src_file.fileno(), offset, 1 << 20):
+            offset += sent
+    except (AttributeError, OSError):
+        # No file-to-file sendfile on this platform (e.g. macOS)
+        src_file.seek(offset)
+        shutil.copyfileobj(src_file, dst_file)
+
+def move_or_read(src, dst, pkg):
+    """Move src to dst with only its package line changed, if that's all it needs.
+
+    Returns None once src has been moved. When the body needs rewriting too,
+    src is left untouched and its bytes are returned instead.
+    """
+    with open(src, 'rb') as src_file:
+        if os.fstat(src_file.fileno()).st_size == 0:
+            return b''
+        with mmap.mmap(src_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _SENTINEL_RE.search(mm) or any(usage_re.search(mm) for usage_re, _, _ in _IMPORTS):
+                return mm[:]
+            match = _PACKAGE_RE.search(mm)
+            if not match or match.group(1) == pkg.encode():
+                header = None
+            else:
+                header = mm[:match.start()] + b'package ' + pkg.encode()
+
+        _ensure_package_dir(dst)
+
+        if header is not None:
+            # Write the new header ourselves and let the kernel copy the rest
+            with open(dst, 'wb') as dst_file:
+                dst_file.write(header)
+                dst_file.flush()
+                _copy_tail(src_file, dst_file, match.end())
+            shutil.copymode(src, dst)
+
+    if header is None:
+        os.replace(src, dst)
+    else:
+        os.remove(src)
+    return None
+
+def rewrite(content, pkg):
+    """Apply every migration step to content."""
+    # Fix package declaration
+    content = _PACKAGE_RE.sub(b'package ' + pkg.encode(), content, count=1)
+
+    # Qualify references to shared helpers
+    content = replace_all(content)
+
+    # Fix function signatures: *Globals -> *cli.Globals
+    content = _RUN_SIG_RE.sub(rb'func (cmd *\1) Run(globals *cli.Globals)', content)
+
+    # Import whichever packages are now referenced
+    for usage_re, path, spec in _IMPORTS:
+        if path not in content and usage_re.search(content):
+            content = add_import(content, spec)
+
+    return content
+
+# Package directories created so far; results are written from the main
+# process only, so each directory is made once
+_created_dirs = set()
+
+def _ensure_package_dir(dst):
+    dst_dir = os.path.dirname(dst)
+    if dst_dir not in _created_dirs:
+        os.makedirs(dst_dir, exist_ok=True)
+        _created_dirs.add(dst_dir)
+
+def write_result(src, dst, pkg, original, content):
+    changed = content != original
+    if src == dst:
+        if not changed:
+            return None
+        with open(dst, 'wb') as f:
+            f.write(content)
+        return f"Updated: {dst}"
+
+    # Everything lives under internal/cli, so an unchanged file moves with a
+    # metadata-only rename. A changed one is written beside its destination
+    # and renamed over it, so src stays intact until dst is complete.
+    _ensure_package_dir(dst)
+    if not changed:
+        os.replace(src, dst)
+    else:
+        tmp = dst + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(content)
+        shutil.copymode(src, tmp)
+        os.replace(tmp, dst)
+        os.unlink(src)
+    return _moved(src, pkg)
+
+def _moved(src, pkg):
+    return f"Moved: {os.path.basename(src)} -> {pkg}/"
+
+def _rules_fingerprint():
+    # Any edit to this script may change the output, so it invalidates the cache
+    with open(__file__, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def _stat_key(path):
+    st = os.stat(path)
+    return [st.st_mtime_ns, st.st_size]
+
+def load_cache(rules):
+    try:
+        with open(CACHE_PATH) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get('rules') != rules:
+        return {}
+    return cache.get('files', {})
+
+def save_cache(rules, files):
+    # Write to a temp file and rename so a crash never leaves a torn cache
+    tmp = CACHE_PATH + '.tmp'
+    with open(tmp, 'w') as f:
+        json.dump({'rules': rules, 'files': files}, f)
+    os.replace(tmp, CACHE_PATH)
+
+def collect_jobs():
+    """Yield (src, dst, pkg) for each file to migrate, walking internal/cli once."""
+    moves = []
+    with os.scandir(cli_dir) as entries:
+        for entry in entries:
+            if entry.name in packages and entry.is_dir():
+                # Files already moved into a subpackage
+                with os.scandir(entry.path) as pkg_entries:
+                    for pkg_entry in pkg_entries:
+                        if pkg_entry.is_file() and pkg_entry.name.endswith('.go'):
+                            yield pkg_entry.path, pkg_entry.path, entry.name
+            elif entry.name in file_mapping and entry.is_file():
+                # Files still in the root package that are due to move.
+                # Packages that don't exist yet are created on the first
+                # move into them.
+                pkg = file_mapping[entry.name]
+                moves.append((entry.path, os.path.join(cli_dir, pkg, entry.name), pkg))
+
+    # Moves go last so a freshly moved file can't turn up again while its
+    # new package is still being scanned
+    yield from moves
+
+def main():
+    if not os.path.isdir(cli_dir):
+        sys.exit(f"{cli_dir} not found; run this from the repository root")
+
+    # Reads, rewrites and writes overlap: a reader thread feeds a process
+    # pool and this thread writes results back in submission order. The
+    # semaphore caps how many files are held in memory at once.
+    in_flight = threading.Semaphore(MAX_IN_FLIGHT)
+    finished = queue.Queue()
+    stop = threading.Event()
+    reader_error = []
+    report = []
+
+    rules = _rules_fingerprint()
+    cache = load_cache(rules)
+    migrated = {}
+
+    def reader(executor):
+        try:
+            for job in collect_jobs():
+                src, dst, _ = job
+                if src == dst:
+                    key = _stat_key(src)
+                    if cache.get(src) == key:
+                        migrated[src] = key
+                        continue
+                in_flight.acquire()
+                if stop.is_set():
+                    break
+                if src == dst:
+                    content = read_source(*job)
+                    if content is None:
+                        migrated[src] = key
+                        in_flight.release()
+                        continue
+                else:
+                    # Moves needing only a new package line are done here
+                    content = move_or_read(*job)
+                    if content is None:
+                        finished.put((job, None, None))
+                        continue
+                # Queued at submit time so every submitted future is seen
+                # before the sentinel, even if this loop fails part way
+                finished.put((job, content, executor.submit(rewrite, content, job[2])))
+        except BaseException as e:
+            reader_error.append(e)
+        finally:
+            finished.put(None)
+
+    with ProcessPoolExecutor() as executor:
+        thread = threading.Thread(target=reader, args=(executor,))
+        thread.start()
+        try:
+            while (item := finished.get()) is not None:
+                job, original, future = item
+                if future is None:
+                    # The reader already moved it verbatim, having checked
+                    # there was nothing else to fix
+                    result = _moved(job[0], job[2])
+                    migrated[job[1]] = _stat_key(job[1])
+                else:
+                    content = future.result()
+                    result = write_result(*job, original, content)
+                    # Only cache files the rewrite actually left clean, e.g.
+                    # not one whose import couldn't be placed
+                    if not _needs_fix(content, job[2]):
+                        migrated[job[1]] = _stat_key(job[1])
+                in_flight.release()
+                if result:
+                    report.append(result)
+        finally:
+            # Unblock the reader if we bailed out early
+            stop.set()
+            for _ in range(MAX_IN_FLIGHT):
+                in_flight.release()
+            thread.join()
+            save_cache(rules, migrated)
+            # One write for the whole report instead of a syscall per
+            # file, flushed even if we bailed out part way
+            if report:
+                sys.stdout.write('\n'.join(report) + '\n')
+
+    if reader_error:
+        raise reader_error[0]
+
+    print("Done migrating!")
+
+if __name__ == '__main__':
+    main()